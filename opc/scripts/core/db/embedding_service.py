@@ -541,6 +541,31 @@ class MockEmbeddingProvider(EmbeddingProvider):
         return self._dimension
 
 
+def get_embedder(provider: str | None = None) -> EmbeddingService:
+    """Get a shared EmbeddingService for a provider, creating it on first use.
+
+    Constructing a provider can be expensive (the local provider loads a
+    multi-GB sentence-transformers model), so callers that embed repeatedly
+    should use this instead of building an EmbeddingService per call.
+
+    Args:
+        provider: Provider name; defaults to EMBEDDING_PROVIDER env var or "local"
+
+    Returns:
+        A cached EmbeddingService instance for that provider
+    """
+    provider = provider or os.getenv("EMBEDDING_PROVIDER", "local")
+    service = _embedder_cache.get(provider)
+    if service is None:
+        service = EmbeddingService(provider=provider)
+        _embedder_cache[provider] = service
+    return service
+
+
+# Shared instances keyed by provider name, populated by get_embedder()
+_embedder_cache: dict[str, "EmbeddingService"] = {}
+
+
 class EmbeddingService:
     """Embedding service with caching and provider abstraction.
 
@@ -574,6 +599,7 @@ class EmbeddingService:
         max_batch_size: int = 100,
         max_retries: int = 3,
         model: str | None = None,
+        batch_window: float = 0.005,
         **kwargs,
     ):
         """Initialize embedding service.
@@ -585,6 +611,8 @@ class EmbeddingService:
             max_batch_size: Maximum texts per batch API call
             max_retries: Maximum retry attempts for transient errors
             model: Model name for provider (e.g., "voyage-3", "voyage-code-3")
+            batch_window: Seconds to coalesce concurrent embed() calls into one
+                provider batch (0 disables coalescing)
             **kwargs: Additional provider-specific arguments
         """
         self.cache_enabled = cache_enabled
@@ -592,6 +620,10 @@ class EmbeddingService:
         self._cache_lock = asyncio.Lock()
         self.max_batch_size = max_batch_size
         self.max_retries = max_retries
+        self.batch_window = batch_window
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._batch_task: asyncio.Task | None = None
+        self._batch_loop: asyncio.AbstractEventLoop | None = None
 
         # Initialize provider
         if provider == "openai":
@@ -642,7 +674,10 @@ class EmbeddingService:
                 if cache_key in self._cache:
                     return self._cache[cache_key]
 
-        embedding = await self._provider.embed(text)
+        if self.batch_window > 0:
+            embedding = await self._embed_coalesced(text)
+        else:
+            embedding = await self._provider.embed(text)
 
         if self.cache_enabled:
             async with self._cache_lock:
@@ -650,6 +685,58 @@ class EmbeddingService:
 
         return embedding
 
+    async def _embed_coalesced(self, text: str) -> list[float]:
+        """Queue a text and await its embedding from the next micro-batch.
+
+        Concurrent embed() calls landing within batch_window are flushed as a
+        single provider embed_batch call, so N parallel callers pay one
+        model/API invocation instead of N.
+        """
+        loop = asyncio.get_running_loop()
+        if self._batch_loop is not loop:
+            # Fresh event loop (e.g. a new asyncio.run): fail any futures
+            # stranded on the old loop so their callers don't hang forever
+            for _, stale_future in self._pending:
+                if not stale_future.done():
+                    stale_future.set_exception(
+                        RuntimeError("Embedding batch abandoned: event loop changed")
+                    )
+            self._batch_loop = loop
+            self._pending = []
+            self._batch_task = None
+
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((text, future))
+        if self._batch_task is None or self._batch_task.done():
+            self._batch_task = loop.create_task(self._flush_pending())
+        return await future
+
+    async def _flush_pending(self) -> None:
+        """Flush queued texts through one provider batch after the window.
+
+        Loops until the queue is drained: callers whose embed() lands while
+        a provider batch is in flight append to _pending without spawning a
+        new task (this one is not done yet), so returning after a single
+        batch would strand those futures forever.
+        """
+        while True:
+            await asyncio.sleep(self.batch_window)
+            pending, self._pending = self._pending, []
+            if not pending:
+                return
+
+            try:
+                embeddings = await self._provider.embed_batch([t for t, _ in pending])
+            except Exception as e:
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), embedding in zip(pending, embeddings):
+                if not future.done():
+                    future.set_result(embedding)
+
     async def embed_batch(self, texts: list[str]) -> list[list[float]]:
         """Generate embeddings for multiple texts.
 
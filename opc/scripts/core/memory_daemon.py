@@ -91,23 +91,54 @@ def use_postgres() -> bool:
 
 
 # Database operations - PostgreSQL
+# The daemon polls every CHECK_INTERVAL, so keep one connection alive with
+# TCP keepalives instead of paying a fresh connect/handshake per query.
+_pg_conn = None
+
+
+def _get_pg_conn():
+    """Get the cached PostgreSQL connection, reconnecting if it died."""
+    global _pg_conn
+    import psycopg2
+    if _pg_conn is not None:
+        try:
+            cur = _pg_conn.cursor()
+            cur.execute("SELECT 1")
+            cur.fetchone()
+            return _pg_conn
+        except psycopg2.Error:
+            try:
+                _pg_conn.close()
+            except psycopg2.Error:
+                pass
+            _pg_conn = None
+    _pg_conn = psycopg2.connect(
+        get_postgres_url(),
+        keepalives=1,
+        keepalives_idle=30,
+        keepalives_interval=10,
+        keepalives_count=3,
+    )
+    # Every statement here is single-statement; autocommit keeps the cached
+    # connection from sitting "idle in transaction" between polls (which
+    # idle_in_transaction_session_timeout would otherwise kill every cycle)
+    _pg_conn.autocommit = True
+    return _pg_conn
+
+
 def pg_ensure_column():
     """Ensure memory_extracted_at column exists in PostgreSQL."""
-    import psycopg2
-    conn = psycopg2.connect(get_postgres_url())
+    conn = _get_pg_conn()
     cur = conn.cursor()
     cur.execute("""
         ALTER TABLE sessions
         ADD COLUMN IF NOT EXISTS memory_extracted_at TIMESTAMP
     """)
-    conn.commit()
-    conn.close()
 
 
 def pg_get_stale_sessions() -> list:
     """Get sessions with stale heartbeat that haven't been extracted."""
-    import psycopg2
-    conn = psycopg2.connect(get_postgres_url())
+    conn = _get_pg_conn()
     cur = conn.cursor()
     threshold = datetime.now() - timedelta(seconds=STALE_THRESHOLD)
     cur.execute("""
@@ -115,21 +146,16 @@ def pg_get_stale_sessions() -> list:
         WHERE last_heartbeat < %s
         AND memory_extracted_at IS NULL
     """, (threshold,))
-    rows = cur.fetchall()
-    conn.close()
-    return rows
+    return cur.fetchall()
 
 
 def pg_mark_extracted(session_id: str):
     """Mark session as extracted in PostgreSQL."""
-    import psycopg2
-    conn = psycopg2.connect(get_postgres_url())
+    conn = _get_pg_conn()
     cur = conn.cursor()
     cur.execute("""
         UPDATE sessions SET memory_extracted_at = NOW() WHERE id = %s
     """, (session_id,))
-    conn.commit()
-    conn.close()
 
 
 # Database operations - SQLite
@@ -289,20 +315,37 @@ Store each learning using store_learning.py with appropriate type and tags."""
         log(f"Failed to start extraction: {e}")
 
 
+def proc_alive(pid: int) -> bool:
+    """Check whether a process exists.
+
+    On Linux a /proc/<pid> stat is cheaper than signalling and works even
+    for processes we lack permission to signal; elsewhere fall back to
+    os.kill(pid, 0).
+    """
+    if sys.platform == "linux":
+        try:
+            os.stat(f"/proc/{pid}")
+            return True
+        except OSError:
+            return False
+    try:
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Process exists but we can't signal it
+        return True
+
+
 def reap_completed_extractions():
     """Check for completed extraction processes and remove from active set."""
     completed = []
     for pid, session_id in active_extractions.items():
-        try:
-            # Check if process is still running (signal 0 = check existence)
-            os.kill(pid, 0)
-        except ProcessLookupError:
+        if not proc_alive(pid):
             # Process finished
             completed.append(pid)
             log(f"Extraction completed for {session_id} (pid={pid})")
-        except PermissionError:
-            # Process exists but we can't signal it - assume still running
-            pass
 
     for pid in completed:
         del active_extractions[pid]
@@ -362,14 +405,17 @@ def is_running() -> tuple[bool, int | None]:
 
     try:
         pid = int(PID_FILE.read_text().strip())
-        # Check if process exists
-        os.kill(pid, 0)
-        return True, pid
-    except (ValueError, ProcessLookupError, PermissionError):
-        # Stale PID file
+    except ValueError:
         PID_FILE.unlink(missing_ok=True)
         return False, None
 
+    if proc_alive(pid):
+        return True, pid
+
+    # Stale PID file
+    PID_FILE.unlink(missing_ok=True)
+    return False, None
+
 
 def _run_as_daemon():
     """Run the daemon loop (called by subprocess on Windows, directly after fork on Unix)."""
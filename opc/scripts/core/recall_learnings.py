@@ -26,15 +26,32 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import hashlib
 import json
 import os
+import re
+import sqlite3
 import sys
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from dotenv import load_dotenv
 
+# Optional orjson: 3-10x faster JSON parse/serialize, falls back to stdlib
+try:
+    import orjson
+
+    def _json_loads(s: str | bytes) -> Any:
+        return orjson.loads(s)
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 # Load .env files
 global_env = Path.home() / ".claude" / ".env"
 if global_env.exists():
@@ -45,6 +62,75 @@ load_dotenv()
 project_dir = os.environ.get("CLAUDE_PROJECT_DIR", str(Path(__file__).parent.parent.parent))
 sys.path.insert(0, project_dir)
 
+# Pre-compiled patterns for query tokenization (avoids per-call re-cache lookups)
+_WORD_RE = re.compile(r"\w+")
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Filler words stripped from queries before full-text search
+_META_WORDS = frozenset({'help', 'want', 'need', 'show', 'tell', 'find', 'look', 'please', 'with', 'for'})
+
+# FTS query stored once so SQLite's statement cache reuses the prepared plan
+_FTS_SQL = """
+    SELECT
+        a.id,
+        a.session_id,
+        a.content,
+        a.metadata_json,
+        a.created_at,
+        bm25(archival_fts) as rank
+    FROM archival_memory a
+    JOIN archival_fts f ON a.rowid = f.rowid
+    WHERE archival_fts MATCH ?
+    ORDER BY rank
+    LIMIT ?
+"""
+
+# Reused read-only SQLite connection (opened once per process)
+_sqlite_conn: sqlite3.Connection | None = None
+
+
+def _get_sqlite_conn(db_path: Path) -> sqlite3.Connection:
+    """Open (once) and reuse a read-only connection to the memory cache DB."""
+    global _sqlite_conn
+    if _sqlite_conn is None:
+        conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        # Keep repeat FTS queries in RAM: mmap the DB and enlarge the page cache
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA query_only=1")
+        _sqlite_conn = conn
+    return _sqlite_conn
+
+
+def _get_embedder(provider: str) -> Any:
+    """Get the shared EmbeddingService for a provider (lazy import)."""
+    from scripts.core.db.embedding_service import get_embedder
+
+    return get_embedder(provider)
+
+
+# LRU of query embeddings keyed by (provider, query hash). Embedding dominates
+# latency for short queries, so repeat queries skip it entirely.
+_EMBED_CACHE: OrderedDict[tuple[str, str], list[float]] = OrderedDict()
+_EMBED_CACHE_MAX = 256
+
+
+async def _embed_query(query: str, provider: str) -> list[float]:
+    """Embed a query string, reusing cached embeddings for repeat queries."""
+    key = (provider, hashlib.sha1(query.strip().lower().encode()).hexdigest())
+    cached = _EMBED_CACHE.get(key)
+    if cached is not None:
+        _EMBED_CACHE.move_to_end(key)
+        return cached
+
+    embedding = await _get_embedder(provider).embed(query)
+
+    _EMBED_CACHE[key] = embedding
+    if len(_EMBED_CACHE) > _EMBED_CACHE_MAX:
+        _EMBED_CACHE.popitem(last=False)
+    return embedding
+
 
 def format_result_preview(content: str, max_length: int = 200) -> str:
     """Format content for display, truncating if needed.
@@ -87,68 +173,64 @@ async def search_learnings_text_only_postgres(query: str, k: int = 5) -> list[di
     pool = await get_pool()
 
     async with pool.acquire() as conn:
-        # Try full-text search using plainto_tsquery (flexible OR semantics)
-        # Strip meta-words and normalize for better matching
-        meta_words = {'help', 'want', 'need', 'show', 'tell', 'find', 'look', 'please', 'with', 'for'}
-        clean_query = query.lower().replace('-', ' ')  # "multi-terminal" -> "multi terminal"
-        clean_query = ' '.join(w for w in clean_query.split() if w not in meta_words)
-        if not clean_query.strip():
-            clean_query = query  # Fallback to original if all stripped
+        # Tokenize, strip meta-words, and drop short tokens in one regex pass
+        # ("multi-terminal search" -> ["multi", "terminal", "search"])
+        query_lower = query.lower()
+        words = [t for t in _TOKEN_RE.findall(query_lower) if len(t) > 2 and t not in _META_WORDS]
+        if not words:
+            # Fallback so the tsquery is never empty (e.g., all meta/short words)
+            words = _TOKEN_RE.findall(query_lower)[:1] or [query.split()[0]]
 
         # Build OR-based query: "session affinity terminal" -> 'session' | 'affinity' | 'terminal'
         # This matches documents containing ANY of the terms, ranked by how many match
-        words = [w for w in clean_query.split() if len(w) > 2]
-        if not words:
-            words = clean_query.split()[:1] or [query.split()[0]]
         or_query = ' | '.join(words)
 
+        # Single round-trip: FTS results, with an ILIKE fallback on the first
+        # word that only produces rows when the FTS branch comes back empty
+        # (query was all stopwords)
+        first_word = query.split()[0] if query.split() else query
         rows = await conn.fetch(
             """
+            WITH fts AS (
+                SELECT
+                    id,
+                    session_id,
+                    content,
+                    metadata,
+                    created_at,
+                    ts_rank(to_tsvector('english', content), to_tsquery('english', $1)) as similarity
+                FROM archival_memory
+                WHERE metadata->>'type' = 'session_learning'
+                    AND to_tsvector('english', content) @@ to_tsquery('english', $1)
+                ORDER BY similarity DESC, created_at DESC
+                LIMIT $3
+            )
+            SELECT * FROM fts
+            UNION ALL
             SELECT
                 id,
                 session_id,
                 content,
                 metadata,
                 created_at,
-                ts_rank(to_tsvector('english', content), to_tsquery('english', $1)) as similarity
+                0.1 as similarity
             FROM archival_memory
-            WHERE metadata->>'type' = 'session_learning'
-                AND to_tsvector('english', content) @@ to_tsquery('english', $1)
+            WHERE NOT EXISTS (SELECT 1 FROM fts)
+                AND metadata->>'type' = 'session_learning'
+                AND content ILIKE '%' || $2 || '%'
             ORDER BY similarity DESC, created_at DESC
-            LIMIT $2
+            LIMIT $3
             """,
             or_query,
+            first_word,
             k,
         )
 
-        # Fallback to ILIKE if no FTS results (query was all stopwords)
-        if not rows:
-            # Extract first word for simple substring match
-            first_word = query.split()[0] if query.split() else query
-            rows = await conn.fetch(
-                """
-                SELECT
-                    id,
-                    session_id,
-                    content,
-                    metadata,
-                    created_at,
-                    0.1 as similarity
-                FROM archival_memory
-                WHERE metadata->>'type' = 'session_learning'
-                    AND content ILIKE '%' || $1 || '%'
-                ORDER BY created_at DESC
-                LIMIT $2
-                """,
-                first_word,
-                k,
-            )
-
     results = []
     for row in rows:
         metadata = row["metadata"]
         if isinstance(metadata, str):
-            metadata = json.loads(metadata)
+            metadata = _json_loads(metadata)
 
         results.append({
             "id": str(row["id"]),
@@ -174,68 +256,48 @@ async def search_learnings_sqlite(query: str, k: int = 5) -> list[dict[str, Any]
     Returns:
         List of matching learnings with BM25 scores
     """
-    import sqlite3
-    import re
-
     # Global SQLite path
     db_path = Path.home() / ".claude" / "cache" / "memory.db"
 
     if not db_path.exists():
         return []
 
-    # Prepare FTS query (OR-join words for broader matching)
-    words = re.findall(r"\w+", query.lower())
-    fts_query = " OR ".join(words) if words else query
+    # Prepare FTS query (OR-join words for broader matching); a query with no
+    # word tokens cannot be parsed by the FTS engine, so skip the DB entirely
+    words = _WORD_RE.findall(query.lower())
+    if not words:
+        return []
+    fts_query = " OR ".join(words)
 
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
+    conn = _get_sqlite_conn(db_path)
 
-    try:
-        cursor = conn.execute(
-            """
-            SELECT
-                a.id,
-                a.session_id,
-                a.content,
-                a.metadata_json,
-                a.created_at,
-                bm25(archival_fts) as rank
-            FROM archival_memory a
-            JOIN archival_fts f ON a.rowid = f.rowid
-            WHERE archival_fts MATCH ?
-            ORDER BY rank
-            LIMIT ?
-            """,
-            (fts_query, k),
-        )
-        rows = cursor.fetchall()
-
-        results = []
-        for row in rows:
-            # BM25 returns negative scores (lower = better)
-            # Normalize to 0.0-1.0 range
-            raw_rank = row["rank"] if row["rank"] else 0
-            normalized_score = min(1.0, max(0.0, -raw_rank / 25.0))
-
-            metadata = {}
-            if row["metadata_json"]:
-                try:
-                    metadata = json.loads(row["metadata_json"])
-                except json.JSONDecodeError:
-                    pass
-
-            results.append({
-                "id": row["id"] or "",
-                "session_id": row["session_id"] or "unknown",
-                "content": row["content"] or "",
-                "metadata": metadata,
-                "created_at": datetime.fromtimestamp(row["created_at"]) if row["created_at"] else None,
-                "similarity": normalized_score,
-            })
-
-        return results
-    finally:
-        conn.close()
+    cursor = conn.execute(_FTS_SQL, (fts_query, k))
+    rows = cursor.fetchall()
+
+    results = []
+    for row in rows:
+        # BM25 returns negative scores (lower = better)
+        # Normalize to 0.0-1.0 range
+        raw_rank = row["rank"] if row["rank"] else 0
+        normalized_score = min(1.0, max(0.0, -raw_rank / 25.0))
+
+        metadata = {}
+        if row["metadata_json"]:
+            try:
+                metadata = _json_loads(row["metadata_json"])
+            except ValueError:
+                pass
+
+        results.append({
+            "id": row["id"] or "",
+            "session_id": row["session_id"] or "unknown",
+            "content": row["content"] or "",
+            "metadata": metadata,
+            "created_at": datetime.fromtimestamp(row["created_at"]) if row["created_at"] else None,
+            "similarity": normalized_score,
+        })
+
+    return results
 
 
 async def search_learnings_hybrid_rrf(
@@ -260,17 +322,12 @@ async def search_learnings_hybrid_rrf(
     Returns:
         List of learnings with RRF scores
     """
-    from scripts.core.db.embedding_service import EmbeddingService
     from scripts.core.db.postgres_pool import get_pool, init_pgvector
 
     pool = await get_pool()
 
-    # Generate query embedding
-    embedder = EmbeddingService(provider=provider)
-    try:
-        query_embedding = await embedder.embed(query)
-    finally:
-        await embedder.aclose()
+    # Generate query embedding (cached for repeat queries)
+    query_embedding = await _embed_query(query, provider)
 
     async with pool.acquire() as conn:
         await init_pgvector(conn)
@@ -324,7 +381,7 @@ async def search_learnings_hybrid_rrf(
             LIMIT $4
             """,
             query,
-            str(query_embedding),
+            query_embedding,
             rrf_k,
             k * 2,  # Fetch more to allow filtering
         )
@@ -338,7 +395,7 @@ async def search_learnings_hybrid_rrf(
 
         metadata = row["metadata"]
         if isinstance(metadata, str):
-            metadata = json.loads(metadata)
+            metadata = _json_loads(metadata)
 
         results.append({
             "id": str(row["id"]),
@@ -378,7 +435,6 @@ async def search_learnings_postgres(
     Returns:
         List of matching learnings with similarity scores
     """
-    from scripts.core.db.embedding_service import EmbeddingService
     from scripts.core.db.postgres_pool import get_pool
 
     pool = await get_pool()
@@ -395,12 +451,8 @@ async def search_learnings_postgres(
         has_embeddings = count_row["cnt"] > 0
 
     if has_embeddings:
-        # Vector similarity search
-        embedder = EmbeddingService(provider=provider)
-        try:
-            query_embedding = await embedder.embed(query)
-        finally:
-            await embedder.aclose()
+        # Vector similarity search (query embedding cached for repeat queries)
+        query_embedding = await _embed_query(query, provider)
 
         async with pool.acquire() as conn:
             from scripts.core.db.postgres_pool import init_pgvector
@@ -431,7 +483,7 @@ async def search_learnings_postgres(
                     ORDER BY combined_score DESC
                     LIMIT $2
                     """,
-                    str(query_embedding),
+                    query_embedding,
                     k,
                     recency_weight,
                 )
@@ -451,7 +503,7 @@ async def search_learnings_postgres(
                     ORDER BY embedding <=> $1::vector
                     LIMIT $2
                     """,
-                    str(query_embedding),
+                    query_embedding,
                     k,
                 )
     elif text_fallback:
@@ -478,10 +530,17 @@ async def search_learnings_postgres(
     else:
         return []
 
-    results = []
-    for row in rows:
-        row_dict = dict(row)  # Convert Record to dict for easier access
+    row_dicts = [dict(row) for row in rows]  # Convert Records to dicts for easier access
+
+    # Batch-parse string metadata in one JSON-array call instead of per-row loads
+    str_indices = [i for i, rd in enumerate(row_dicts) if isinstance(rd["metadata"], str)]
+    if str_indices:
+        parsed = _json_loads("[" + ",".join(row_dicts[i]["metadata"] for i in str_indices) + "]")
+        for i, meta in zip(str_indices, parsed):
+            row_dicts[i]["metadata"] = meta
 
+    results = []
+    for row_dict in row_dicts:
         # Use combined_score if available (recency boost), otherwise similarity
         if "combined_score" in row_dict:
             score = float(row_dict["combined_score"]) if row_dict["combined_score"] else 0.0
@@ -493,8 +552,6 @@ async def search_learnings_postgres(
             continue
 
         metadata = row_dict["metadata"]
-        if isinstance(metadata, str):
-            metadata = json.loads(metadata)
 
         result = {
             "id": str(row_dict["id"]),
@@ -642,28 +699,32 @@ async def main() -> int:
             )
     except Exception as e:
         if args.json:
-            print(json.dumps({"error": str(e), "results": []}))
+            print(_json_dumps({"error": str(e), "results": []}))
         else:
             print(f"Error: {e}", file=sys.stderr)
         return 1
 
-    # JSON output mode
+    # JSON output mode: stream the array instead of materializing a second
+    # copy of every row before dumping (halves peak memory for large k)
     if args.json:
-        json_results = []
-        for result in results:
+        write = sys.stdout.write
+        write('{"results":[')
+        for i, result in enumerate(results):
             created_at = result["created_at"]
             if isinstance(created_at, datetime):
                 created_str = created_at.isoformat()
             else:
                 created_str = str(created_at)
 
-            json_results.append({
+            if i:
+                write(",")
+            write(_json_dumps({
                 "score": result["similarity"],
                 "session_id": result["session_id"],
                 "content": result["content"],
                 "created_at": created_str,
-            })
-        print(json.dumps({"results": json_results}))
+            }))
+        write(']}\n')
         return 0
 
     # Human-readable output
@@ -39,9 +39,11 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import hashlib
 import json
 import os
 import sys
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -57,6 +59,23 @@ load_dotenv()
 project_dir = os.environ.get("CLAUDE_PROJECT_DIR", str(Path(__file__).parent.parent.parent))
 sys.path.insert(0, project_dir)
 
+# Memory imports depend on the sys.path entry above. Failures are kept as a
+# sentinel so the store functions can report them in their result dict
+# instead of crashing at import time.
+try:
+    from scripts.core.db.embedding_service import get_embedder
+    from scripts.core.db.memory_factory import (
+        create_memory_service,
+        get_default_backend,
+    )
+
+    _import_error: ImportError | None = None
+except ImportError as e:
+    create_memory_service = None
+    get_default_backend = None
+    get_embedder = None
+    _import_error = e
+
 # Valid learning types for --type parameter
 LEARNING_TYPES = [
     "FAILED_APPROACH",
@@ -75,6 +94,32 @@ CONFIDENCE_LEVELS = ["high", "medium", "low"]
 DEDUP_THRESHOLD = 0.85
 
 
+# Content hashes of recently stored learnings, mapping to their memory id.
+# Exact repeats (hook retries, double-fired extractors) skip embedding and
+# the dedup search entirely; the vector check below still catches
+# near-duplicates and anything stored by other processes.
+_recent_hashes: OrderedDict[str, str] = OrderedDict()
+_RECENT_HASHES_MAX = 10000
+
+
+def _content_hash(content: str) -> str:
+    """Stable 64-bit hash of normalized content for exact-duplicate checks."""
+    return hashlib.sha256(content.strip().lower().encode()).hexdigest()[:16]
+
+
+def _remember_hash(content_hash: str, memory_id: str) -> None:
+    """Record a stored learning's content hash, evicting the oldest past cap."""
+    _recent_hashes[content_hash] = memory_id
+    _recent_hashes.move_to_end(content_hash)
+    if len(_recent_hashes) > _RECENT_HASHES_MAX:
+        _recent_hashes.popitem(last=False)
+
+
+def _nonempty(value: str) -> bool:
+    """True when a legacy field carries real content (not empty or "None")."""
+    return bool(value) and value.strip().lower() != "none"
+
+
 async def store_learning_v2(
     session_id: str,
     content: str,
@@ -96,18 +141,22 @@ async def store_learning_v2(
     Returns:
         dict with success status, memory_id, or skipped info for duplicates
     """
-    try:
-        from scripts.core.db.memory_factory import (
-            create_memory_service,
-            get_default_backend,
-        )
-        from scripts.core.db.embedding_service import EmbeddingService
-    except ImportError as e:
-        return {"success": False, "error": f"Memory service not available: {e}"}
+    if create_memory_service is None:
+        return {"success": False, "error": f"Memory service not available: {_import_error}"}
 
     if not content or not content.strip():
         return {"success": False, "error": "No content provided"}
 
+    # Exact-duplicate fast path: skip embedding (the expensive step) entirely
+    content_hash = _content_hash(content)
+    if content_hash in _recent_hashes:
+        return {
+            "success": True,
+            "skipped": True,
+            "reason": "duplicate (exact content match)",
+            "existing_id": _recent_hashes[content_hash],
+        }
+
     # Get backend - prefer postgres if connection string is set
     if os.environ.get("CONTINUOUS_CLAUDE_DB_URL") or os.environ.get("DATABASE_URL"):
         backend = "postgres"
@@ -121,12 +170,30 @@ async def store_learning_v2(
         )
 
         # Generate embedding
-        embedder = EmbeddingService(provider=os.getenv("EMBEDDING_PROVIDER", "local"))
+        embedder = get_embedder()
         embedding = await embedder.embed(content)
 
+        # Kick off the dedup search and build metadata while it's in flight
+        search_task = asyncio.create_task(memory.search_vector(embedding, limit=1))
+
+        metadata = {
+            "type": "session_learning",
+            "session_id": session_id,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+
+        if learning_type:
+            metadata["learning_type"] = learning_type
+        if context:
+            metadata["context"] = context
+        if tags:
+            metadata["tags"] = tags
+        if confidence:
+            metadata["confidence"] = confidence
+
         # Deduplication check: search for similar existing memories
         try:
-            existing = await memory.search_vector(embedding, limit=1)
+            existing = await search_task
             if existing and len(existing) > 0:
                 top_match = existing[0]
                 similarity = top_match.get("similarity", 0)
@@ -142,22 +209,6 @@ async def store_learning_v2(
             # If search fails, proceed with storing (don't block on dedup errors)
             pass
 
-        # Build metadata
-        metadata = {
-            "type": "session_learning",
-            "session_id": session_id,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-        }
-
-        if learning_type:
-            metadata["learning_type"] = learning_type
-        if context:
-            metadata["context"] = context
-        if tags:
-            metadata["tags"] = tags
-        if confidence:
-            metadata["confidence"] = confidence
-
         # Store with embedding
         memory_id = await memory.store(
             content,
@@ -167,6 +218,8 @@ async def store_learning_v2(
 
         await memory.close()
 
+        _remember_hash(content_hash, memory_id)
+
         return {
             "success": True,
             "memory_id": memory_id,
@@ -179,6 +232,128 @@ async def store_learning_v2(
         return {"success": False, "error": str(e)}
 
 
+async def store_learnings_batch(
+    session_id: str,
+    items: list[dict],
+) -> list[dict]:
+    """Store multiple learnings in one call, embedding them as a single batch.
+
+    Embedding carries the same fixed per-call overhead whether it processes
+    one text or thirty, so callers with several learnings (e.g. the memory
+    extractor at session end) should use this instead of looping over
+    store_learning_v2.
+
+    Args:
+        session_id: Session identifier
+        items: List of dicts with the store_learning_v2 fields:
+            content (required), learning_type, context, tags, confidence
+
+    Returns:
+        List of per-item result dicts, same order as items
+    """
+    if create_memory_service is None:
+        return [{"success": False, "error": f"Memory service not available: {_import_error}"} for _ in items]
+
+    if not items:
+        return []
+
+    contents = [(item.get("content") or "").strip() for item in items]
+    if not any(contents):
+        return [{"success": False, "error": "No content provided"} for _ in items]
+
+    # Get backend - prefer postgres if connection string is set
+    if os.environ.get("CONTINUOUS_CLAUDE_DB_URL") or os.environ.get("DATABASE_URL"):
+        backend = "postgres"
+    else:
+        backend = get_default_backend()
+
+    memory = None
+    results: list[dict] = []
+    try:
+        memory = await create_memory_service(
+            backend=backend,
+            session_id=session_id,
+        )
+
+        # One embedding call for the whole batch
+        embedder = get_embedder()
+        to_embed = [c for c in contents if c]
+        embeddings = iter(await embedder.embed_batch(to_embed))
+
+        # Dedup searches are independent - run them concurrently
+        item_embeddings = [next(embeddings) if c else None for c in contents]
+        searches = await asyncio.gather(
+            *(
+                memory.search_vector(emb, limit=1)
+                for emb in item_embeddings
+                if emb is not None
+            ),
+            return_exceptions=True,
+        )
+        searches = iter(searches)
+
+        for item, content, embedding in zip(items, contents, item_embeddings):
+            if embedding is None:
+                results.append({"success": False, "error": "No content provided"})
+                continue
+
+            existing = next(searches)
+            if not isinstance(existing, Exception) and existing:
+                similarity = existing[0].get("similarity", 0)
+                if similarity >= DEDUP_THRESHOLD:
+                    results.append({
+                        "success": True,
+                        "skipped": True,
+                        "reason": f"duplicate (similarity: {similarity:.2f})",
+                        "existing_id": existing[0].get("id"),
+                    })
+                    continue
+
+            metadata = {
+                "type": "session_learning",
+                "session_id": session_id,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            }
+            for key in ("learning_type", "context", "tags", "confidence"):
+                if item.get(key):
+                    metadata[key] = item[key]
+
+            # A failed store only fails its own item; earlier items already
+            # stored must keep reporting success
+            try:
+                memory_id = await memory.store(
+                    content,
+                    metadata=metadata,
+                    embedding=embedding,
+                )
+            except Exception as e:
+                results.append({"success": False, "error": str(e)})
+                continue
+
+            _remember_hash(_content_hash(content), memory_id)
+            results.append({
+                "success": True,
+                "memory_id": memory_id,
+                "backend": backend,
+                "content_length": len(content),
+                "embedding_dim": len(embedding),
+            })
+
+        return results
+
+    except Exception as e:
+        # Setup failure (service creation, embedding, dedup search): fail
+        # only the items that never got a result
+        results.extend(
+            {"success": False, "error": str(e)} for _ in items[len(results):]
+        )
+        return results
+
+    finally:
+        if memory is not None:
+            await memory.close()
+
+
 async def store_learning(
     session_id: str,
     worked: str,
@@ -198,25 +373,24 @@ async def store_learning(
     Returns:
         dict with success status and memory_id
     """
-    try:
-        from scripts.core.db.memory_factory import (
-            create_memory_service,
-            get_default_backend,
-        )
-        from scripts.core.db.embedding_service import EmbeddingService
-    except ImportError as e:
-        return {"success": False, "error": f"Memory service not available: {e}"}
-
-    # Build learning content
-    learning_parts = []
-    if worked and worked.lower() != "none":
-        learning_parts.append(f"What worked: {worked}")
-    if failed and failed.lower() != "none":
-        learning_parts.append(f"What failed: {failed}")
-    if decisions and decisions.lower() != "none":
-        learning_parts.append(f"Decisions: {decisions}")
-    if patterns and patterns.lower() != "none":
-        learning_parts.append(f"Patterns: {patterns}")
+    if create_memory_service is None:
+        return {"success": False, "error": f"Memory service not available: {_import_error}"}
+
+    # One _nonempty check per field drives both the content assembly and the
+    # categories metadata, so the two can't drift apart
+    fields = {
+        "worked": ("What worked", worked),
+        "failed": ("What failed", failed),
+        "decisions": ("Decisions", decisions),
+        "patterns": ("Patterns", patterns),
+    }
+    flags = {name: _nonempty(value) for name, (_, value) in fields.items()}
+
+    learning_parts = [
+        f"{label}: {value}"
+        for name, (label, value) in fields.items()
+        if flags[name]
+    ]
 
     if not learning_parts:
         return {"success": False, "error": "No learning content provided"}
@@ -228,12 +402,7 @@ async def store_learning(
         "type": "session_learning",
         "session_id": session_id,
         "timestamp": datetime.now(timezone.utc).isoformat(),
-        "categories": {
-            "worked": bool(worked and worked.lower() != "none"),
-            "failed": bool(failed and failed.lower() != "none"),
-            "decisions": bool(decisions and decisions.lower() != "none"),
-            "patterns": bool(patterns and patterns.lower() != "none"),
-        }
+        "categories": flags,
     }
 
     # Get backend - prefer postgres if connection string is set
@@ -249,7 +418,7 @@ async def store_learning(
         )
 
         # Generate embedding using local provider (no API key needed)
-        embedder = EmbeddingService(provider=os.getenv("EMBEDDING_PROVIDER", "local"))
+        embedder = get_embedder()
         embedding = await embedder.embed(learning_content)
 
         # Store with embedding for semantic search
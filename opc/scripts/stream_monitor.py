@@ -12,8 +12,13 @@ See docs/cli-native-agent-architecture.md Section 8 for full spec.
 import asyncio
 import json
 import logging
+import os
+import queue
+import selectors
 import subprocess
 import threading
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
@@ -22,23 +27,73 @@ from collections.abc import Callable
 
 logger = logging.getLogger(__name__)
 
+# Optional orjson: C-backed JSON parse/serialize for the per-event hot path,
+# falls back to stdlib
+try:
+    import orjson
+
+    def _json_loads(s: str | bytes) -> Any:
+        return orjson.loads(s)
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 
 # Redis TTL for hot events
 REDIS_EVENT_TTL = 24 * 60 * 60  # 24 hours
 
+# Redis push batching: the writer thread flushes when this many events are
+# queued or the flush interval has elapsed, whichever comes first
+REDIS_BATCH_MAX = 50
+REDIS_FLUSH_INTERVAL = 1.0  # seconds
+REDIS_QUEUE_SIZE = 10_000
+
+# Cap on events held in memory; older events were already pushed to Redis
+# by the writer thread, so eviction only trims the local snapshot
+MAX_EVENTS_IN_MEMORY = 10_000
+
 # Stuck detection thresholds
 CONSECUTIVE_TOOL_THRESHOLD = 5
 CONSECUTIVE_THINKING_THRESHOLD = 5
 
+# Known event types, resolved via the explicit "type" field when present
+_TYPE_MAP = {
+    t: t for t in ("thinking", "tool_use", "tool_result", "text", "error", "result")
+}
+# Fallback for untyped payloads: first matching top-level key wins
+_FALLBACK_KEYS = ("thinking", "tool_use", "tool_result", "text", "error")
+
+
+def _event_type_of(data: dict) -> str:
+    """Resolve an event's type with one lookup instead of a branch chain."""
+    event_type = _TYPE_MAP.get(data.get("type"))
+    if event_type is not None:
+        return event_type
+    for key in _FALLBACK_KEYS:
+        if key in data:
+            return key
+    return "unknown"
+
 
-@dataclass
+@dataclass(slots=True)
 class StreamEvent:
     """Parsed event from Claude stream-json output."""
 
     event_type: str  # "thinking", "tool_use", "tool_result", "text", "error"
-    timestamp: str
     data: dict[str, Any]
     turn_number: int = 0
+    # Capturing the clock is a cheap integer read; ISO formatting is deferred
+    # until the event is actually serialized
+    timestamp_ns: int = field(default_factory=time.time_ns)
+
+    @property
+    def timestamp(self) -> str:
+        """ISO-8601 wall-clock timestamp, formatted on demand."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9, UTC).isoformat()
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -50,18 +105,26 @@ class StreamEvent:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class MonitorState:
     """Internal state for a monitored agent."""
 
     agent_id: str
-    events: list[StreamEvent] = field(default_factory=list)
+    events: deque[StreamEvent] = field(
+        default_factory=lambda: deque(maxlen=MAX_EVENTS_IN_MEMORY)
+    )
+    # Running count of all events seen, including any evicted from the deque
+    total_events: int = 0
     turn_count: int = 0
-    consecutive_tool_calls: list[str] = field(default_factory=list)
+    last_tool: str | None = None
+    consecutive_tool_count: int = 0
     consecutive_thinking: int = 0
     is_stuck: bool = False
     stuck_reason: str | None = None
     started_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+    # Monotonic anchor so duration is a single integer subtraction rather
+    # than a wall-clock string round-trip
+    started_ns: int = field(default_factory=time.monotonic_ns)
     completed_at: str | None = None
     exit_code: int | None = None
 
@@ -105,30 +168,34 @@ class StreamMonitor:
         self._thread: threading.Thread | None = None
         self._stop_event = threading.Event()
         self._lock = threading.Lock()
+        self._redis_q: queue.Queue[str | None] = queue.Queue(maxsize=REDIS_QUEUE_SIZE)
+        self._redis_thread: threading.Thread | None = None
+        # The key never changes for a monitor's lifetime; format it once
+        self._redis_key = f"agent:{agent_id}:events"
+
+    # Single-attribute reads are atomic under the GIL, so the reader
+    # properties skip the mutex and never contend with the monitor thread.
+    # Multi-field snapshots (get_events, get_summary) still take the lock.
 
     @property
     def is_stuck(self) -> bool:
         """Check if agent is detected as stuck."""
-        with self._lock:
-            return self._state.is_stuck
+        return self._state.is_stuck
 
     @property
     def stuck_reason(self) -> str | None:
         """Get reason for stuck detection."""
-        with self._lock:
-            return self._state.stuck_reason
+        return self._state.stuck_reason
 
     @property
     def turn_count(self) -> int:
         """Get current turn count."""
-        with self._lock:
-            return self._state.turn_count
+        return self._state.turn_count
 
     @property
     def event_count(self) -> int:
         """Get total event count."""
-        with self._lock:
-            return len(self._state.events)
+        return self._state.total_events
 
     def get_events(self, limit: int | None = None) -> list[dict]:
         """Get events (most recent first if limit specified).
@@ -154,6 +221,13 @@ class StreamMonitor:
         if self._thread is not None:
             raise RuntimeError("Monitor already started")
 
+        if self.redis_client:
+            self._redis_thread = threading.Thread(
+                target=self._redis_writer,
+                daemon=True,
+            )
+            self._redis_thread.start()
+
         self._thread = threading.Thread(
             target=self._monitor_loop,
             args=(process,),
@@ -170,34 +244,40 @@ class StreamMonitor:
         self._stop_event.set()
         if self._thread:
             self._thread.join(timeout=timeout)
+        if self._redis_thread:
+            # Sentinel tells the writer to flush what's queued and exit
+            self._redis_q.put(None)
+            self._redis_thread.join(timeout=timeout)
 
     def _monitor_loop(self, process: subprocess.Popen) -> None:
         """Background thread loop for monitoring process output."""
+        # Checked once: skips the per-line message formatting when DEBUG is
+        # off, which is the production default
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         try:
-            # Read from process stdout line by line
-            for line in iter(process.stdout.readline, b""):
-                if self._stop_event.is_set():
-                    break
-
-                if not line:
-                    continue
-
-                # Handle both bytes and str
-                if isinstance(line, bytes):
-                    line = line.decode("utf-8", errors="replace")
-
-                line = line.strip()
-                if not line:
-                    continue
-
+            # Prefer non-blocking fd reads so _stop_event is honored within
+            # the poll timeout instead of blocking until the next newline
+            try:
+                fd = process.stdout.fileno()
+                os.set_blocking(fd, False)
+                sel = selectors.DefaultSelector()
+                sel.register(fd, selectors.EVENT_READ)
+            except (OSError, ValueError):
+                sel = None
+
+            if sel is not None:
                 try:
-                    event = self._parse_event(line)
-                    if event:
-                        self._process_event(event)
-                except json.JSONDecodeError:
-                    logger.debug(f"Non-JSON line: {line[:100]}")
-                except Exception as e:
-                    logger.warning(f"Error processing event: {e}")
+                    self._follow_fd(fd, sel, debug_enabled)
+                finally:
+                    sel.close()
+            else:
+                # Pipe isn't selectable on this platform; read line by line
+                for line in iter(process.stdout.readline, b""):
+                    if self._stop_event.is_set():
+                        break
+                    if not line:
+                        continue
+                    self._handle_line(line, debug_enabled)
 
             # Process completed
             process.wait()
@@ -208,6 +288,57 @@ class StreamMonitor:
         except Exception as e:
             logger.error(f"Monitor loop error: {e}")
 
+    def _follow_fd(self, fd: int, sel: selectors.BaseSelector, debug_enabled: bool) -> None:
+        """Read the stdout fd non-blocking, splitting lines from one buffer.
+
+        One os.read per buffer-full instead of one readline per line, and
+        the selector timeout bounds how long stop() has to wait.
+        """
+        buffer = bytearray()
+        while not self._stop_event.is_set():
+            if not sel.select(timeout=0.1):
+                continue
+            try:
+                chunk = os.read(fd, 65536)
+            except BlockingIOError:
+                continue
+            except OSError:
+                break
+
+            if chunk:
+                buffer.extend(chunk)
+                while True:
+                    newline = buffer.find(b"\n")
+                    if newline < 0:
+                        break
+                    raw = bytes(buffer[:newline])
+                    del buffer[: newline + 1]
+                    self._handle_line(raw, debug_enabled)
+            else:
+                # EOF: flush any unterminated trailing line
+                if buffer:
+                    self._handle_line(bytes(buffer), debug_enabled)
+                break
+
+    def _handle_line(self, line: bytes | str, debug_enabled: bool) -> None:
+        """Decode, parse, and process one raw output line."""
+        if isinstance(line, bytes):
+            line = line.decode("utf-8", errors="replace")
+
+        line = line.strip()
+        if not line:
+            return
+
+        try:
+            event = self._parse_event(line)
+            if event:
+                self._process_event(event)
+        except json.JSONDecodeError:
+            if debug_enabled:
+                logger.debug(f"Non-JSON line: {line[:100]}")
+        except Exception as e:
+            logger.warning(f"Error processing event: {e}")
+
     def _parse_event(self, line: str) -> StreamEvent | None:
         """Parse a stream-json line into a StreamEvent.
 
@@ -217,86 +348,89 @@ class StreamMonitor:
         Returns:
             StreamEvent or None if not a valid event.
         """
-        data = json.loads(line)
-
-        # Determine event type from structure
-        event_type = "unknown"
-        if "thinking" in data or data.get("type") == "thinking":
-            event_type = "thinking"
-        elif "tool_use" in data or data.get("type") == "tool_use":
-            event_type = "tool_use"
-        elif "tool_result" in data or data.get("type") == "tool_result":
-            event_type = "tool_result"
-        elif "text" in data or data.get("type") == "text":
-            event_type = "text"
-        elif "error" in data or data.get("type") == "error":
-            event_type = "error"
-        elif data.get("type") == "result":
-            event_type = "result"
+        data = _json_loads(line)
+        event_type = _event_type_of(data)
 
         return StreamEvent(
             event_type=event_type,
-            timestamp=datetime.now(UTC).isoformat(),
             data=data,
             turn_number=self._state.turn_count,
         )
 
+    def _trigger_stuck(self, reason: str) -> None:
+        """Mark the agent stuck and fire the callback, once per run.
+
+        Called with the lock held; subsequent triggers are no-ops so the
+        callback fires a single time rather than on every event past the
+        threshold.
+        """
+        state = self._state
+        if state.is_stuck:
+            return
+        state.is_stuck = True
+        state.stuck_reason = reason
+        if self.on_stuck:
+            try:
+                self.on_stuck(reason)
+            except Exception as e:
+                logger.warning(f"Stuck callback error: {e}")
+
     def _process_event(self, event: StreamEvent) -> None:
         """Process a parsed event - update state, detect stuck, push to Redis.
 
         Args:
             event: Parsed stream event.
         """
+        # Hoist the state lookup out of the attribute-heavy hot path
+        state = self._state
         with self._lock:
             # Add to event list
-            self._state.events.append(event)
+            state.events.append(event)
+            state.total_events += 1
 
             # Update turn count on tool results (indicates turn completion)
             if event.event_type == "tool_result":
-                self._state.turn_count += 1
+                state.turn_count += 1
 
             # Track consecutive tool calls for stuck detection
             if event.event_type == "tool_use":
                 tool_name = event.data.get("tool", event.data.get("name", "unknown"))
-                self._state.consecutive_tool_calls.append(tool_name)
-                self._state.consecutive_thinking = 0
+                if tool_name == state.last_tool:
+                    state.consecutive_tool_count += 1
+                else:
+                    state.last_tool = tool_name
+                    state.consecutive_tool_count = 1
+                state.consecutive_thinking = 0
 
                 # Check for stuck (same tool 5+ times)
-                if len(self._state.consecutive_tool_calls) >= CONSECUTIVE_TOOL_THRESHOLD:
-                    recent = self._state.consecutive_tool_calls[-CONSECUTIVE_TOOL_THRESHOLD:]
-                    if len(set(recent)) == 1:
-                        self._state.is_stuck = True
-                        self._state.stuck_reason = (
-                            f"Same tool '{recent[0]}' called {CONSECUTIVE_TOOL_THRESHOLD}+ times"
-                        )
-                        if self.on_stuck:
-                            self.on_stuck(self._state.stuck_reason)
+                if state.consecutive_tool_count >= CONSECUTIVE_TOOL_THRESHOLD:
+                    self._trigger_stuck(
+                        f"Same tool '{tool_name}' called {CONSECUTIVE_TOOL_THRESHOLD}+ times"
+                    )
 
             elif event.event_type == "thinking":
-                self._state.consecutive_thinking += 1
+                state.consecutive_thinking += 1
 
                 # Check for stuck (thinking 5+ times in a row)
-                if self._state.consecutive_thinking >= CONSECUTIVE_THINKING_THRESHOLD:
-                    self._state.is_stuck = True
-                    self._state.stuck_reason = (
+                if state.consecutive_thinking >= CONSECUTIVE_THINKING_THRESHOLD:
+                    self._trigger_stuck(
                         f"Agent stuck in thinking ({CONSECUTIVE_THINKING_THRESHOLD}+ consecutive)"
                     )
-                    if self.on_stuck:
-                        self.on_stuck(self._state.stuck_reason)
 
             else:
                 # Reset consecutive counters on other event types
-                self._state.consecutive_tool_calls = []
-                self._state.consecutive_thinking = 0
+                state.last_tool = None
+                state.consecutive_tool_count = 0
+                state.consecutive_thinking = 0
 
-        # Push to Redis if available
+        # Hand off to the Redis writer thread; never block the monitor on
+        # Redis latency. A full queue means Redis is far behind - drop the
+        # event from the hot cache rather than stall parsing.
         if self.redis_client:
             try:
-                key = f"agent:{self.agent_id}:events"
-                self.redis_client.lpush(key, json.dumps(event.to_dict()))
-                self.redis_client.expire(key, REDIS_EVENT_TTL)
-            except Exception as e:
-                logger.warning(f"Redis push failed: {e}")
+                self._redis_q.put_nowait(_json_dumps(event.to_dict()))
+            except queue.Full:
+                logger.warning("Redis event queue full; dropping event")
 
         # Call event callback
         if self.on_event:
@@ -305,6 +439,50 @@ class StreamMonitor:
             except Exception as e:
                 logger.warning(f"Event callback error: {e}")
 
+    def _redis_writer(self) -> None:
+        """Background thread draining the event queue into pipelined pushes.
+
+        Batches whatever has accumulated (up to REDIS_BATCH_MAX) so Redis
+        latency spikes are absorbed here instead of the monitor thread.
+        Exits when the None sentinel from stop() is seen.
+        """
+        while True:
+            try:
+                item = self._redis_q.get(timeout=REDIS_FLUSH_INTERVAL)
+            except queue.Empty:
+                if self._stop_event.is_set():
+                    return
+                continue
+
+            if item is None:
+                return
+
+            batch = [item]
+            done = False
+            while len(batch) < REDIS_BATCH_MAX:
+                try:
+                    item = self._redis_q.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    done = True
+                    break
+                batch.append(item)
+
+            self._push_batch(batch)
+            if done:
+                return
+
+    def _push_batch(self, batch: list[str]) -> None:
+        """Push a batch of serialized events to Redis in one round-trip."""
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.lpush(self._redis_key, *batch)
+            pipe.expire(self._redis_key, REDIS_EVENT_TTL)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Redis push failed: {e}")
+
     def get_summary(self) -> dict:
         """Get summary of monitored agent.
 
@@ -314,12 +492,13 @@ class StreamMonitor:
         with self._lock:
             return {
                 "agent_id": self.agent_id,
-                "event_count": len(self._state.events),
+                "event_count": self._state.total_events,
                 "turn_count": self._state.turn_count,
                 "is_stuck": self._state.is_stuck,
                 "stuck_reason": self._state.stuck_reason,
                 "started_at": self._state.started_at,
                 "completed_at": self._state.completed_at,
+                "duration_ms": (time.monotonic_ns() - self._state.started_ns) / 1e6,
                 "exit_code": self._state.exit_code,
             }
 
@@ -339,43 +518,49 @@ async def monitor_agent_async(
     Returns:
         Final MonitorState after completion.
     """
+    # Local import: only this async tail path needs aiofiles; the
+    # thread-based StreamMonitor stays importable without it
+    import aiofiles
+
     state = MonitorState(agent_id=agent_id)
 
-    # Wait for file to exist
+    # Wait for file to exist, backing off so a slow-starting agent doesn't
+    # cost a fixed-rate polling loop. The stat syscall runs in a worker
+    # thread so the event loop never blocks on disk.
     path = Path(output_file)
-    while not path.exists():
-        await asyncio.sleep(0.1)
-
-    # Tail the file
-    with open(output_file) as f:
+    idle_sleep = 0.01
+    while not await asyncio.to_thread(path.exists):
+        await asyncio.sleep(idle_sleep)
+        idle_sleep = min(idle_sleep * 2, 1.0)
+
+    # Tail the file without blocking the event loop on reads
+    idle_sleep = 0.01
+    async with aiofiles.open(output_file) as f:
         while True:
-            line = f.readline()
+            line = await f.readline()
             if not line:
-                # Check if process is still running
-                await asyncio.sleep(0.1)
+                # Nothing new yet: back off exponentially up to 1s, then
+                # snap back to fast polling once output resumes
+                await asyncio.sleep(idle_sleep)
+                idle_sleep = min(idle_sleep * 2, 1.0)
                 continue
+            idle_sleep = 0.01
 
             line = line.strip()
             if not line:
                 continue
 
             try:
-                data = json.loads(line)
-                event_type = "unknown"
-                if "thinking" in data or data.get("type") == "thinking":
-                    event_type = "thinking"
-                elif "tool_use" in data or data.get("type") == "tool_use":
-                    event_type = "tool_use"
-                elif "tool_result" in data or data.get("type") == "tool_result":
-                    event_type = "tool_result"
+                data = _json_loads(line)
+                event_type = _event_type_of(data)
 
                 event = StreamEvent(
                     event_type=event_type,
-                    timestamp=datetime.now(UTC).isoformat(),
                     data=data,
                     turn_number=state.turn_count,
                 )
                 state.events.append(event)
+                state.total_events += 1
 
                 if event_type == "tool_result":
                     state.turn_count += 1